@@ -0,0 +1,76 @@
+"""Small numeric kernels for the audio path.
+
+Kernels are JIT-compiled with numba when it is installed (``vv[fast]``) and
+fall back to equivalent in-place NumPy calls otherwise.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from vv._scratch import ScratchBuffers, get_float_buf, get_int16_buf
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+
+    # Compiled eagerly for contiguous float32 so the first call, made from the
+    # audio callback, does not stall on JIT compilation. Serial on purpose:
+    # the pass is memory-bound and numba's default threading layer is not
+    # safe to enter from several threads at once.
+    @njit("void(float32[::1])", fastmath=True, cache=True)
+    def _clip_inplace_jit(x):  # type: ignore[no-untyped-def]
+        for i in range(x.shape[0]):
+            v = x[i]
+            if v > 1.0:
+                x[i] = 1.0
+            elif v < -1.0:
+                x[i] = -1.0
+
+
+def clip_inplace(x: NDArray[np.float32]) -> None:
+    """Clamp a contiguous 1-D float32 array to [-1.0, 1.0] in place."""
+    if HAS_NUMBA:
+        _clip_inplace_jit(x)
+    else:
+        np.clip(x, -1.0, 1.0, out=x)
+
+
+def to_pcm16(
+    x: NDArray[np.float32],
+    scratch: ScratchBuffers | None = None,
+) -> NDArray[np.int16]:
+    """Convert float32 samples in [-1.0, 1.0] to int16 PCM.
+
+    The result is a scratch buffer, overwritten by the next call that uses
+    the same scratch, or by the next call in this thread if scratch is None.
+    """
+    if scratch is None:
+        scaled_buf = get_float_buf(len(x), "pcm16")
+        pcm = get_int16_buf(len(x), "pcm16")
+    else:
+        scaled_buf = scratch.get(len(x), np.float32, "pcm16")
+        pcm = scratch.get(len(x), np.int16, "pcm16")
+    scaled = np.multiply(x, 32767.0, dtype=np.float32, out=scaled_buf)
+    np.clip(scaled, -32767.0, 32767.0, out=scaled)
+    np.copyto(pcm, scaled, casting="unsafe")
+    return pcm
+
+
+def from_pcm16(
+    pcm: NDArray[np.int16],
+    out: NDArray[np.float32] | None = None,
+) -> NDArray[np.float32]:
+    """Convert int16 PCM to float32 samples, writing into out if given."""
+    return np.multiply(pcm, 1.0 / 32767.0, dtype=np.float32, out=out)
@@ -0,0 +1,58 @@
+"""Reusable scratch buffers for the audio path.
+
+Each (key, dtype) pair owns one buffer. A buffer grows by at least doubling
+when a larger size is requested and never shrinks, so a long interactive
+session stops allocating once it has seen its largest recording. Callers get
+a view into the buffer that stays valid until the next request for the same
+key from the same owner.
+
+The module-level helpers keep one set of buffers per thread. Code that runs
+on short-lived threads can hold its own ScratchBuffers instead, so the
+buffers survive the thread.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+
+class ScratchBuffers:
+    """A set of growable buffers, not safe to share between threads at once."""
+
+    def __init__(self) -> None:
+        self._bufs: dict[tuple[str, type[Any]], NDArray[Any]] = {}
+
+    def get(self, n: int, dtype: type[Any], key: str = "default") -> NDArray[Any]:
+        """Return an uninitialized view of length n."""
+        buf = self._bufs.get((key, dtype))
+        if buf is None or len(buf) < n:
+            size = n if buf is None else max(n, 2 * len(buf))
+            buf = np.empty(size, dtype=dtype)
+            self._bufs[(key, dtype)] = buf
+        return buf[:n]
+
+
+_local = threading.local()
+
+
+def _thread_scratch() -> ScratchBuffers:
+    scratch: ScratchBuffers | None = getattr(_local, "scratch", None)
+    if scratch is None:
+        scratch = _local.scratch = ScratchBuffers()
+    return scratch
+
+
+def get_float_buf(n: int, key: str = "default") -> NDArray[np.float32]:
+    """Return an uninitialized float32 view of length n."""
+    return _thread_scratch().get(n, np.float32, key)
+
+
+def get_int16_buf(n: int, key: str = "default") -> NDArray[np.int16]:
+    """Return an uninitialized int16 view of length n."""
+    return _thread_scratch().get(n, np.int16, key)
@@ -2,65 +2,139 @@
 
 from __future__ import annotations
 
+import queue
 import sys
 import threading
-from typing import TYPE_CHECKING
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import sounddevice as sd
 
+from vv._fast import clip_inplace
+from vv._scratch import get_float_buf
+
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
+# Length of the pre-allocated recording arena. Longer recordings spill over
+# into per-block copies so nothing is lost.
+MAX_SECONDS = 600
+
 
 def list_devices() -> str:
     """Return a formatted string of available audio input devices."""
     devices = sd.query_devices()
+    try:
+        default = sd.query_devices(kind="input")
+    except (sd.PortAudioError, ValueError):
+        default = None  # No default input device, e.g. on a headless machine
     lines = ["Available audio input devices:", ""]
 
     for i, device in enumerate(devices):
         if device["max_input_channels"] > 0:
-            default_marker = " (default)" if device == sd.query_devices(kind="input") else ""
+            default_marker = " (default)" if device == default else ""
             lines.append(f"  [{i}] {device['name']}{default_marker}")
 
     return "\n".join(lines)
 
 
+def _join_blocks(
+    head: NDArray[np.float32],
+    blocks: list[NDArray[np.float32]],
+) -> NDArray[np.float32]:
+    """Copy head followed by blocks into one newly allocated array."""
+    total = len(head) + sum(len(block) for block in blocks)
+    out = np.empty(total, dtype=np.float32)
+    out[: len(head)] = head
+    i = len(head)
+    for block in blocks:
+        n = len(block)
+        out[i : i + n] = block
+        i += n
+    return out
+
+
+def stream_chunks(
+    chunk_queue: queue.Queue[NDArray[np.float32] | None],
+) -> Iterator[NDArray[np.float32]]:
+    """Yield chunks from record_audio's chunk_queue as they arrive."""
+    while (chunk := chunk_queue.get()) is not None:
+        yield chunk
+
+
 def record_audio(
     sample_rate: int = 16000,
     quiet: bool = False,
+    chunk_queue: queue.Queue[NDArray[np.float32] | None] | None = None,
+    chunk_seconds: float = 5.0,
 ) -> tuple[NDArray[np.float32], float, int]:
     """Record audio from the default microphone until Enter is pressed.
 
     Args:
         sample_rate: Audio sample rate in Hz (default: 16000 for Whisper)
         quiet: If True, suppress recording prompts
+        chunk_queue: If given, receives the audio in chunks of about
+            chunk_seconds while recording, followed by None when it stops
+        chunk_seconds: Chunk length for chunk_queue
 
     Returns:
-        Tuple of (audio_data, duration_seconds, sample_rate)
+        Tuple of (audio_data, duration_seconds, sample_rate). audio_data may
+        share memory with the next recording; copy it to keep it longer.
 
     Raises:
         SystemExit: If microphone cannot be accessed
     """
-    recording: list[NDArray[np.float32]] = []
+    # The arena is allocated once per thread and reused by every recording,
+    # so the callback only copies into memory that is already mapped
+    buf = get_float_buf(sample_rate * MAX_SECONDS, "record")
+    # Byte view of the arena, so raw blocks are copied in with a plain memcpy
+    buf_bytes = buf.data.cast("B")
+    itemsize = buf.itemsize
+    write_idx = [0]
+    queued_idx = [0]
+    chunk_frames = int(sample_rate * chunk_seconds)
+    overflow: list[NDArray[np.float32]] = []
     stop_event = threading.Event()
 
     def callback(
-        indata: NDArray[np.float32],
+        indata: Any,
         frames: int,
         time_info: dict,
         status: sd.CallbackFlags,
     ) -> None:
         if status:
             print(f"Warning: {status}", file=sys.stderr)
-        if not stop_event.is_set():
-            recording.append(indata.copy())
+        if stop_event.is_set():
+            return
+        start = write_idx[0]
+        end = start + frames
+        if end <= len(buf):
+            buf_bytes[start * itemsize : end * itemsize] = indata
+            # Clip each block as it lands, before it is queued, to prevent
+            # overflow when converting to int16 later
+            clip_inplace(buf[start:end])
+            write_idx[0] = end
+            if chunk_queue is not None and end - queued_idx[0] >= chunk_frames:
+                chunk_queue.put_nowait(buf[queued_idx[0] : end])
+                queued_idx[0] = end
+        else:
+            block = np.frombuffer(indata, dtype=np.float32).copy()
+            clip_inplace(block)
+            overflow.append(block)
+            if chunk_queue is not None:
+                if queued_idx[0] < start:
+                    chunk_queue.put_nowait(buf[queued_idx[0] : start])
+                    queued_idx[0] = start
+                chunk_queue.put_nowait(block)
 
     try:
-        stream = sd.InputStream(
+        # The raw stream hands the callback a plain buffer instead of building
+        # a NumPy array for every block
+        stream = sd.RawInputStream(
             samplerate=sample_rate,
             channels=1,
-            dtype=np.float32,
+            dtype="float32",
             callback=callback,
         )
     except sd.PortAudioError as e:
@@ -82,12 +156,17 @@ def record_audio(
     finally:
         stop_event.set()
 
-    if not recording:
+    if chunk_queue is not None:
+        if not overflow and queued_idx[0] < write_idx[0]:
+            chunk_queue.put_nowait(buf[queued_idx[0] : write_idx[0]])
+        chunk_queue.put_nowait(None)
+
+    if write_idx[0] == 0 and not overflow:
         return np.array([], dtype=np.float32), 0.0, sample_rate
 
-    audio_data = np.concatenate(recording, axis=0)
-    # Clip to prevent overflow when converting to int16 later
-    audio_data = np.clip(audio_data, -1.0, 1.0)
+    audio_data = buf[: write_idx[0]]
+    if overflow:
+        audio_data = _join_blocks(audio_data, overflow)
     duration = len(audio_data) / sample_rate
 
     return audio_data, duration, sample_rate
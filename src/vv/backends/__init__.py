@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import functools
 import platform
 import sys
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -12,13 +15,32 @@ if TYPE_CHECKING:
     from numpy.typing import NDArray
 
 
+@dataclass(slots=True, frozen=True)
+class Segment:
+    """A transcribed segment, times in seconds.
+
+    Word-level timestamps, when requested, are stored as parallel sequences
+    (words[i] spans word_starts[i] to word_ends[i]) rather than as one
+    object per word. Backends fill them with array("d") only when there are
+    words; segments without words share the empty tuple defaults.
+    """
+
+    start: float
+    end: float
+    text: str
+    words: tuple[str, ...] = ()
+    # Excluded from the hash since arrays are unhashable
+    word_starts: Sequence[float] = field(default=(), hash=False)
+    word_ends: Sequence[float] = field(default=(), hash=False)
+
+
 class TranscriptionResult:
     """Result from transcription."""
 
     def __init__(
         self,
         text: str,
-        segments: list[dict] | None = None,
+        segments: list[Segment] | None = None,
         language: str | None = None,
     ):
         self.text = text
@@ -40,6 +62,8 @@ class TranscriptionBackend(ABC):
         audio: NDArray[np.float32],
         language: str | None = None,
         word_timestamps: bool = False,
+        beam_size: int = 5,
+        condition_on_previous_text: bool = True,
     ) -> TranscriptionResult:
         """Transcribe audio data.
 
@@ -47,12 +71,88 @@ class TranscriptionBackend(ABC):
             audio: Audio data as float32 numpy array
             language: Language code (e.g., 'en') or None for auto-detect
             word_timestamps: Whether to include word-level timestamps
+            beam_size: Beam width for decoding; 1 decodes greedily
+            condition_on_previous_text: Whether to prompt each window with
+                the text decoded so far
 
         Returns:
             TranscriptionResult with text and optional segments
         """
         pass
 
+    def transcribe_stream(
+        self,
+        chunks: Iterable[NDArray[np.float32]],
+        language: str | None = None,
+        word_timestamps: bool = False,
+        beam_size: int = 5,
+        condition_on_previous_text: bool = True,
+    ) -> TranscriptionResult:
+        """Transcribe audio that arrives in chunks while it is being recorded.
+
+        The default implementation waits for the last chunk and transcribes
+        everything at once. Backends that can make progress on partial audio
+        override this.
+
+        Args:
+            chunks: Iterable of float32 numpy arrays (mono, 16kHz)
+            language: Language code (e.g., 'en') or None for auto-detect
+            word_timestamps: Whether to include word-level timestamps
+            beam_size: Beam width for decoding; 1 decodes greedily
+            condition_on_previous_text: Whether to prompt each window with
+                the text decoded so far
+
+        Returns:
+            TranscriptionResult with text and optional segments
+        """
+        import numpy as np
+
+        parts = list(chunks)
+        if not parts:
+            return TranscriptionResult(text="")
+        return self.transcribe(
+            np.concatenate(parts),
+            language=language,
+            word_timestamps=word_timestamps,
+            beam_size=beam_size,
+            condition_on_previous_text=condition_on_previous_text,
+        )
+
+    def transcribe_batch(
+        self,
+        audios: Sequence[NDArray[np.float32]],
+        language: str | None = None,
+        word_timestamps: bool = False,
+        beam_size: int = 5,
+        condition_on_previous_text: bool = True,
+    ) -> list[TranscriptionResult]:
+        """Transcribe several short recordings, returning one result each.
+
+        The default implementation transcribes them one at a time. Backends
+        that can batch the encoder pass override this.
+
+        Args:
+            audios: Float32 numpy arrays (mono, 16kHz), each at most 30s long
+            language: Language code (e.g., 'en') or None for auto-detect
+            word_timestamps: Whether to include word-level timestamps
+            beam_size: Beam width for decoding; 1 decodes greedily
+            condition_on_previous_text: Whether to prompt each window with
+                the text decoded so far
+
+        Returns:
+            List of TranscriptionResult, in the same order as audios
+        """
+        return [
+            self.transcribe(
+                audio,
+                language=language,
+                word_timestamps=word_timestamps,
+                beam_size=beam_size,
+                condition_on_previous_text=condition_on_previous_text,
+            )
+            for audio in audios
+        ]
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -60,11 +160,13 @@ class TranscriptionBackend(ABC):
         pass
 
 
+@functools.lru_cache(maxsize=1)
 def get_backend() -> TranscriptionBackend:
     """Select optimal transcription backend for current platform.
 
     On Apple Silicon, prefers mlx-whisper if available.
     Falls back to faster-whisper on all platforms.
+    The backend is created once per process and shared by later calls.
 
     Returns:
         TranscriptionBackend instance
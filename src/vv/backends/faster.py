@@ -3,20 +3,42 @@
 from __future__ import annotations
 
 import sys
-from typing import TYPE_CHECKING
+from array import array
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any
 
-from vv.backends import TranscriptionBackend, TranscriptionResult
+import numpy as np
+
+from vv.backends import Segment, TranscriptionBackend, TranscriptionResult
 
 if TYPE_CHECKING:
-    import numpy as np
     from numpy.typing import NDArray
 
+SAMPLE_RATE = 16000
+# Whisper decodes audio in 30 second windows
+WINDOW_SAMPLES = 30 * SAMPLE_RATE
+
+
+def _to_segment(segment: Any, word_timestamps: bool, offset: float = 0.0) -> Segment:
+    """Convert a faster-whisper segment, shifting times by offset seconds."""
+    if not (word_timestamps and segment.words):
+        return Segment(segment.start + offset, segment.end + offset, segment.text.strip())
+    return Segment(
+        segment.start + offset,
+        segment.end + offset,
+        segment.text.strip(),
+        words=tuple(w.word for w in segment.words),
+        word_starts=array("d", (w.start + offset for w in segment.words)),
+        word_ends=array("d", (w.end + offset for w in segment.words)),
+    )
+
 
 class FasterWhisperBackend(TranscriptionBackend):
     """Transcription backend using faster-whisper (CTranslate2)."""
 
     def __init__(self) -> None:
         self._model = None
+        self._batched = None
 
     @property
     def name(self) -> str:
@@ -29,25 +51,61 @@ class FasterWhisperBackend(TranscriptionBackend):
             model_size: One of tiny, base, small, medium, large-v2, large-v3
         """
         try:
-            from faster_whisper import WhisperModel
+            from faster_whisper import BatchedInferencePipeline, WhisperModel
         except ImportError:
             print("Error: faster-whisper is not installed.", file=sys.stderr)
             print("Install with: pip install faster-whisper", file=sys.stderr)
             sys.exit(4)
 
         try:
-            # Use int8 quantization for smaller memory footprint
-            # auto device selection (cuda if available, else cpu)
-            self._model = WhisperModel(model_size, device="auto", compute_type="int8")
+            # Keep int8 weights everywhere for a smaller memory footprint. On
+            # CUDA GPUs with efficient float16, run activations in float16 so
+            # the int8 GEMMs use tensor cores.
+            import ctranslate2
+
+            device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+            compute_type = "int8"
+            if (
+                device == "cuda"
+                and "int8_float16" in ctranslate2.get_supported_compute_types("cuda")
+            ):
+                compute_type = "int8_float16"
+            self._model = WhisperModel(model_size, device=device, compute_type=compute_type)
+            self._batched = BatchedInferencePipeline(model=self._model)
         except Exception as e:
             print(f"Error loading model '{model_size}': {e}", file=sys.stderr)
             sys.exit(4)
 
+    def _run(
+        self,
+        audio: NDArray[np.float32],
+        language: str | None,
+        word_timestamps: bool,
+        beam_size: int,
+        condition_on_previous_text: bool,
+        initial_prompt: str | None = None,
+    ) -> tuple[list[Any], Any]:
+        """Run the model and collect its segments."""
+        assert self._model is not None
+        segments_iter, info = self._model.transcribe(
+            audio,
+            language=language,
+            word_timestamps=word_timestamps,
+            beam_size=beam_size,
+            initial_prompt=initial_prompt,
+            # Verbatim transcription settings
+            suppress_tokens=[],  # Don't suppress any tokens
+            condition_on_previous_text=condition_on_previous_text,
+        )
+        return list(segments_iter), info
+
     def transcribe(
         self,
         audio: NDArray[np.float32],
         language: str | None = None,
         word_timestamps: bool = False,
+        beam_size: int = 5,
+        condition_on_previous_text: bool = True,
     ) -> TranscriptionResult:
         """Transcribe audio using faster-whisper.
 
@@ -55,6 +113,9 @@ class FasterWhisperBackend(TranscriptionBackend):
             audio: Audio data as float32 numpy array (mono, 16kHz)
             language: Language code or None for auto-detect
             word_timestamps: Whether to include word-level timestamps
+            beam_size: Beam width for decoding; 1 decodes greedily
+            condition_on_previous_text: Whether to prompt each window with
+                the text decoded so far
 
         Returns:
             TranscriptionResult with text and segments
@@ -62,44 +123,193 @@ class FasterWhisperBackend(TranscriptionBackend):
         if self._model is None:
             raise RuntimeError("Model not loaded. Call load_model() first.")
 
-        # Flatten audio if needed
+        # Flatten audio if needed; reshape avoids a copy for column-shaped input
         if audio.ndim > 1:
-            audio = audio.flatten()
+            audio = np.ascontiguousarray(audio.reshape(-1))
+
+        try:
+            segments, info = self._run(
+                audio, language, word_timestamps, beam_size, condition_on_previous_text
+            )
+
+            return TranscriptionResult(
+                text="".join(seg.text for seg in segments).strip(),
+                segments=[_to_segment(seg, word_timestamps) for seg in segments],
+                language=info.language,
+            )
+
+        except Exception as e:
+            print(f"Error during transcription: {e}", file=sys.stderr)
+            sys.exit(5)
+
+    def transcribe_stream(
+        self,
+        chunks: Iterable[NDArray[np.float32]],
+        language: str | None = None,
+        word_timestamps: bool = False,
+        beam_size: int = 5,
+        condition_on_previous_text: bool = True,
+    ) -> TranscriptionResult:
+        """Transcribe each 30 second window as soon as it has been recorded.
+
+        The last segment of a window may be cut off mid-word, so it is left
+        pending and decoded again at the start of the next window. With
+        condition_on_previous_text, earlier text is passed along as the
+        prompt so the decoder stays conditioned across windows.
+
+        Args:
+            chunks: Iterable of float32 numpy arrays (mono, 16kHz)
+            language: Language code or None for auto-detect
+            word_timestamps: Whether to include word-level timestamps
+            beam_size: Beam width for decoding; 1 decodes greedily
+            condition_on_previous_text: Whether to prompt each window with
+                the text decoded so far
+
+        Returns:
+            TranscriptionResult with text and segments
+        """
+        if self._model is None:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+
+        pending: list[NDArray[np.float32]] = []
+        pending_len = 0
+        offset = 0  # Samples already committed
+        segments: list[Segment] = []
+        text_parts: list[str] = []
+
+        def prompt() -> str | None:
+            if not condition_on_previous_text:
+                return None
+            return "".join(text_parts) or None
 
         try:
-            segments_iter, info = self._model.transcribe(
-                audio,
+            for chunk in chunks:
+                pending.append(chunk)
+                pending_len += len(chunk)
+                if pending_len < WINDOW_SAMPLES:
+                    continue
+
+                audio = np.concatenate(pending)
+                window, info = self._run(
+                    audio,
+                    language,
+                    word_timestamps,
+                    beam_size,
+                    condition_on_previous_text,
+                    prompt(),
+                )
+                # Lock in the detected language so every window agrees
+                language = language or info.language
+
+                committed, consumed = window, len(audio)
+                if len(window) > 1:
+                    end = min(int(window[-2].end * SAMPLE_RATE), len(audio))
+                    if end > 0:
+                        committed, consumed = window[:-1], end
+
+                for seg in committed:
+                    text_parts.append(seg.text)
+                    segments.append(
+                        _to_segment(seg, word_timestamps, offset / SAMPLE_RATE)
+                    )
+                offset += consumed
+                pending = [audio[consumed:]]
+                pending_len = len(pending[0])
+
+            if pending_len:
+                window, info = self._run(
+                    np.concatenate(pending),
+                    language,
+                    word_timestamps,
+                    beam_size,
+                    condition_on_previous_text,
+                    prompt(),
+                )
+                language = language or info.language
+                for seg in window:
+                    text_parts.append(seg.text)
+                    segments.append(
+                        _to_segment(seg, word_timestamps, offset / SAMPLE_RATE)
+                    )
+
+            return TranscriptionResult(
+                text="".join(text_parts).strip(),
+                segments=segments,
+                language=language,
+            )
+
+        except Exception as e:
+            print(f"Error during transcription: {e}", file=sys.stderr)
+            sys.exit(5)
+
+    def transcribe_batch(
+        self,
+        audios: Sequence[NDArray[np.float32]],
+        language: str | None = None,
+        word_timestamps: bool = False,
+        beam_size: int = 5,
+        condition_on_previous_text: bool = True,
+    ) -> list[TranscriptionResult]:
+        """Transcribe several short recordings in one batched model call.
+
+        Each recording is zero padded to its own 30 second window and becomes
+        one row of a BatchedInferencePipeline batch, so their encoder passes
+        share a batch instead of running one after another. The language is
+        detected once for the whole batch. Batched decoding never conditions
+        on previous text.
+
+        Args:
+            audios: Float32 numpy arrays (mono, 16kHz), each at most 30s long
+            language: Language code or None for auto-detect
+            word_timestamps: Whether to include word-level timestamps
+            beam_size: Beam width for decoding; 1 decodes greedily
+            condition_on_previous_text: Ignored by batched decoding
+
+        Returns:
+            List of TranscriptionResult, in the same order as audios
+        """
+        if self._model is None or self._batched is None:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+        if not audios:
+            return []
+
+        # The pipeline merges clips into windows of up to 30s, so clips that
+        # cover a whole padded window each get a window of their own
+        padded = np.zeros(len(audios) * WINDOW_SAMPLES, dtype=np.float32)
+        for i, audio in enumerate(audios):
+            audio = audio.reshape(-1)
+            padded[i * WINDOW_SAMPLES : i * WINDOW_SAMPLES + len(audio)] = audio
+        window = WINDOW_SAMPLES / SAMPLE_RATE
+        clips = [{"start": i * window, "end": (i + 1) * window} for i in range(len(audios))]
+        window_frames = int(window * self._model.frames_per_second)
+
+        try:
+            segments_iter, info = self._batched.transcribe(
+                padded,
                 language=language,
                 word_timestamps=word_timestamps,
-                # Verbatim transcription settings
+                beam_size=beam_size,
                 suppress_tokens=[],  # Don't suppress any tokens
-                condition_on_previous_text=True,
+                without_timestamps=False,
+                clip_timestamps=clips,
+                batch_size=len(audios),
             )
 
-            # Collect segments
-            segments = []
-            text_parts = []
+            # A segment's seek is the frame offset of the window it came from
+            per_clip: list[list[Any]] = [[] for _ in audios]
             for segment in segments_iter:
-                text_parts.append(segment.text)
-                seg_dict = {
-                    "start": segment.start,
-                    "end": segment.end,
-                    "text": segment.text.strip(),
-                }
-                if word_timestamps and segment.words:
-                    seg_dict["words"] = [
-                        {"start": w.start, "end": w.end, "word": w.word}
-                        for w in segment.words
-                    ]
-                segments.append(seg_dict)
-
-            text = "".join(text_parts).strip()
+                per_clip[segment.seek // window_frames].append(segment)
 
-            return TranscriptionResult(
-                text=text,
-                segments=segments,
-                language=info.language,
-            )
+            return [
+                TranscriptionResult(
+                    text="".join(seg.text for seg in segments).strip(),
+                    segments=[
+                        _to_segment(seg, word_timestamps, -i * window) for seg in segments
+                    ],
+                    language=info.language,
+                )
+                for i, segments in enumerate(per_clip)
+            ]
 
         except Exception as e:
             print(f"Error during transcription: {e}", file=sys.stderr)
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import sys
+from array import array
 from typing import TYPE_CHECKING
 
-from vv.backends import TranscriptionBackend, TranscriptionResult
+import numpy as np
+
+from vv.backends import Segment, TranscriptionBackend, TranscriptionResult
 
 if TYPE_CHECKING:
-    import numpy as np
     from numpy.typing import NDArray
 
 
@@ -50,13 +52,30 @@ class MLXBackend(TranscriptionBackend):
             sys.exit(4)
 
         self._model_path = model_map[model_size]
-        # Model will be downloaded on first transcribe if not cached
+
+        # Load the weights now instead of on the first transcribe. mlx-whisper
+        # keeps the last loaded model in ModelHolder, so later sessions in
+        # this process reuse it.
+        try:
+            import mlx.core as mx
+            from mlx_whisper.transcribe import ModelHolder
+        except ImportError:
+            return  # Older mlx-whisper; the model loads on first transcribe
+
+        try:
+            # Same dtype transcribe() requests by default, so the cache hits
+            ModelHolder.get_model(self._model_path, mx.float16)
+        except Exception as e:
+            print(f"Error loading model '{model_size}': {e}", file=sys.stderr)
+            sys.exit(4)
 
     def transcribe(
         self,
         audio: NDArray[np.float32],
         language: str | None = None,
         word_timestamps: bool = False,
+        beam_size: int = 5,
+        condition_on_previous_text: bool = True,
     ) -> TranscriptionResult:
         """Transcribe audio using mlx-whisper.
 
@@ -64,6 +83,9 @@ class MLXBackend(TranscriptionBackend):
             audio: Audio data as float32 numpy array (mono, 16kHz)
             language: Language code or None for auto-detect
             word_timestamps: Whether to include word-level timestamps
+            beam_size: Beam width for decoding; 1 decodes greedily
+            condition_on_previous_text: Whether to prompt each window with
+                the text decoded so far
 
         Returns:
             TranscriptionResult with text and segments
@@ -73,9 +95,9 @@ class MLXBackend(TranscriptionBackend):
 
         import mlx_whisper
 
-        # Flatten audio if needed
+        # Flatten audio if needed; reshape avoids a copy for column-shaped input
         if audio.ndim > 1:
-            audio = audio.flatten()
+            audio = np.ascontiguousarray(audio.reshape(-1))
 
         try:
             result = mlx_whisper.transcribe(
@@ -83,6 +105,8 @@ class MLXBackend(TranscriptionBackend):
                 path_or_hf_repo=self._model_path,
                 language=language,
                 word_timestamps=word_timestamps,
+                # mlx-whisper always decodes greedily, so beam_size is not passed
+                condition_on_previous_text=condition_on_previous_text,
             )
 
             # Parse result
@@ -90,17 +114,23 @@ class MLXBackend(TranscriptionBackend):
             segments = []
 
             for seg in result.get("segments", []):
-                seg_dict = {
-                    "start": seg.get("start", 0),
-                    "end": seg.get("end", 0),
-                    "text": seg.get("text", "").strip(),
-                }
-                if word_timestamps and "words" in seg:
-                    seg_dict["words"] = [
-                        {"start": w["start"], "end": w["end"], "word": w["word"]}
-                        for w in seg["words"]
-                    ]
-                segments.append(seg_dict)
+                start = seg.get("start", 0)
+                end = seg.get("end", 0)
+                seg_text = seg.get("text", "").strip()
+                if word_timestamps and seg.get("words"):
+                    words = seg["words"]
+                    segments.append(
+                        Segment(
+                            start,
+                            end,
+                            seg_text,
+                            words=tuple(w["word"] for w in words),
+                            word_starts=array("d", (w["start"] for w in words)),
+                            word_ends=array("d", (w["end"] for w in words)),
+                        )
+                    )
+                else:
+                    segments.append(Segment(start, end, seg_text))
 
             return TranscriptionResult(
                 text=text,
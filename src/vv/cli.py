@@ -3,18 +3,44 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import queue
 import sys
+import threading
+from typing import TYPE_CHECKING, TextIO
 
 from vv import __version__
-from vv.audio import list_devices, record_audio
-from vv.backends import TranscriptionResult, get_backend
+
+# Audio and backend modules pull in numpy and PortAudio, so they are imported
+# inside main() once we know they are needed. That keeps --help and
+# --version fast.
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+    from vv.backends import Segment, TranscriptionBackend, TranscriptionResult
+
+
+# Recordings shorter than this are queued for --batch transcription
+BATCH_MAX_SECONDS = 5.0
+
+# Zero-padded seconds, indexed by the seconds value
+_SS = [f"{i:02d}" for i in range(60)]
 
 
 def format_timestamp(seconds: float) -> str:
     """Format seconds as MM:SS."""
     minutes = int(seconds // 60)
     secs = int(seconds % 60)
-    return f"{minutes}:{secs:02d}"
+    return f"{minutes}:{_SS[secs]}"
+
+
+def _segments_to_lines(segments: list[Segment]) -> list[str]:
+    """Format segments as '[start-end] text' lines."""
+    return [
+        f"[{format_timestamp(seg.start)}-{format_timestamp(seg.end)}] {seg.text}"
+        for seg in segments
+    ]
 
 
 def format_output(
@@ -22,6 +48,7 @@ def format_output(
     duration: float,
     show_timestamps: bool = False,
     quiet: bool = False,
+    timestamp_lines: list[str] | None = None,
 ) -> str:
     """Format transcription result for output.
 
@@ -30,18 +57,17 @@ def format_output(
         duration: Recording duration in seconds
         show_timestamps: Whether to include timestamps
         quiet: If True, return only the text
+        timestamp_lines: Precomputed _segments_to_lines(result.segments)
 
     Returns:
         Formatted output string
     """
+    if show_timestamps and result.segments and timestamp_lines is None:
+        timestamp_lines = _segments_to_lines(result.segments)
+
     if quiet:
-        if show_timestamps and result.segments:
-            lines = []
-            for seg in result.segments:
-                start = format_timestamp(seg["start"])
-                end = format_timestamp(seg["end"])
-                lines.append(f"[{start}-{end}] {seg['text']}")
-            return "\n".join(lines)
+        if show_timestamps and timestamp_lines:
+            return "\n".join(timestamp_lines)
         return result.text
 
     # Full output with decoration
@@ -53,11 +79,8 @@ def format_output(
         "",
     ]
 
-    if show_timestamps and result.segments:
-        for seg in result.segments:
-            start = format_timestamp(seg["start"])
-            end = format_timestamp(seg["end"])
-            lines.append(f"[{start}-{end}] {seg['text']}")
+    if show_timestamps and timestamp_lines:
+        lines.extend(timestamp_lines)
     else:
         lines.append(result.text)
 
@@ -71,6 +94,51 @@ def format_output(
     return "\n".join(lines)
 
 
+class TranscriptionThread(threading.Thread):
+    """Transcribe recorded chunks in the background while recording continues."""
+
+    def __init__(
+        self,
+        backend: TranscriptionBackend,
+        chunk_queue: queue.Queue[NDArray[np.float32] | None],
+        language: str | None = None,
+        word_timestamps: bool = False,
+        beam_size: int = 5,
+        condition_on_previous_text: bool = True,
+    ) -> None:
+        super().__init__(daemon=True)
+        self._backend = backend
+        self._chunk_queue = chunk_queue
+        self._language = language
+        self._word_timestamps = word_timestamps
+        self._beam_size = beam_size
+        self._condition_on_previous_text = condition_on_previous_text
+        self._result: TranscriptionResult | None = None
+        self._error: BaseException | None = None
+
+    def run(self) -> None:
+        from vv.audio import stream_chunks
+
+        try:
+            self._result = self._backend.transcribe_stream(
+                stream_chunks(self._chunk_queue),
+                language=self._language,
+                word_timestamps=self._word_timestamps,
+                beam_size=self._beam_size,
+                condition_on_previous_text=self._condition_on_previous_text,
+            )
+        except BaseException as e:  # Includes SystemExit raised by backends
+            self._error = e
+
+    def result(self) -> TranscriptionResult:
+        """Wait for transcription to finish and return its result."""
+        self.join()
+        if self._error is not None:
+            raise self._error
+        assert self._result is not None
+        return self._result
+
+
 def copy_to_clipboard(text: str) -> bool:
     """Copy text to system clipboard.
 
@@ -85,8 +153,79 @@ def copy_to_clipboard(text: str) -> bool:
         return False
 
 
+def _write_stdout(text: str) -> None:
+    """Write text and a newline to stdout's binary buffer in one call.
+
+    Used in quiet mode, where the output is usually piped and needs none of
+    print()'s text-layer handling.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        print(text)
+        return
+    sys.stdout.flush()  # Keep anything already written through the text layer first
+    data = (text + "\n").encode(sys.stdout.encoding or "utf-8", sys.stdout.errors or "strict")
+    buffer.write(data)
+    buffer.flush()
+
+
+def _output_result(
+    result: TranscriptionResult,
+    duration: float,
+    args: argparse.Namespace,
+    out_file: TextIO | None,
+) -> bool:
+    """Send a transcription to the destinations selected on the command line.
+
+    Returns:
+        False if writing to the output file failed, True otherwise
+    """
+    timestamp_lines = None
+    if args.timestamps and result.segments:
+        timestamp_lines = _segments_to_lines(result.segments)
+    output = format_output(
+        result,
+        duration,
+        show_timestamps=args.timestamps,
+        quiet=args.quiet,
+        timestamp_lines=timestamp_lines,
+    )
+
+    # Handle output destinations
+    if out_file is not None:
+        try:
+            out_file.write(output if output.endswith("\n") else output + "\n")
+            if not args.quiet:
+                print(f"Saved to {args.output}")
+        except OSError as e:
+            print(f"Error writing to file: {e}", file=sys.stderr)
+            return False
+    elif args.quiet:
+        _write_stdout(output)
+    else:
+        print(output)
+
+    # Copy to clipboard if requested
+    if args.copy:
+        text_to_copy = result.text
+        if timestamp_lines:
+            text_to_copy = "\n".join(timestamp_lines)
+
+        if copy_to_clipboard(text_to_copy):
+            if not args.quiet:
+                print("Copied to clipboard.")
+        else:
+            print("Warning: Could not copy to clipboard", file=sys.stderr)
+
+    return True
+
+
+@functools.lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
-    """Create and configure argument parser."""
+    """Create and configure argument parser.
+
+    The parser is built once per process and shared by later calls.
+    """
     parser = argparse.ArgumentParser(
         prog="vv",
         description="Verbatim voice transcription using Whisper",
@@ -99,6 +238,7 @@ Examples:
   vv -q | pbcopy        Quiet mode, pipe to clipboard (macOS)
   vv -o transcript.txt  Save transcription to file
   vv -l en              Force English (skip auto-detection)
+  vv --daemon &         Keep the model loaded for faster startup
 """,
     )
 
@@ -151,12 +291,41 @@ Examples:
         help="Include segment timestamps in output",
     )
 
+    parser.add_argument(
+        "--beam-size",
+        type=int,
+        metavar="N",
+        help="Beam width for decoding (default: 1 with -q or -1, otherwise 5)",
+    )
+
+    parser.add_argument(
+        "--no-condition",
+        action="store_true",
+        help="Don't condition on previously transcribed text (default with -q or -1)",
+    )
+
+    parser.add_argument(
+        "--batch",
+        type=int,
+        metavar="N",
+        help=(
+            f"Transcribe recordings shorter than {BATCH_MAX_SECONDS:g}s together, "
+            "N at a time (interactive mode only)"
+        ),
+    )
+
     parser.add_argument(
         "--list-devices",
         action="store_true",
         help="Show available audio devices and exit",
     )
 
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep the model loaded and serve other vv processes",
+    )
+
     return parser
 
 
@@ -167,11 +336,40 @@ def main() -> int:
 
     # Handle --list-devices
     if args.list_devices:
+        from vv.audio import list_devices
+
         print(list_devices())
         return 0
 
-    # Initialize backend and load model
-    backend = get_backend()
+    # Handle --daemon
+    if args.daemon:
+        from vv.daemon import serve
+
+        return serve(args.model, quiet=args.quiet)
+
+    if args.beam_size is not None and args.beam_size < 1:
+        parser.error("--beam-size must be at least 1")
+    if args.batch is not None and args.batch < 1:
+        parser.error("--batch must be at least 1")
+
+    # Single-shot and scripted runs favour latency: decode greedily and
+    # without the previous-text prompt unless asked otherwise
+    fast = args.quiet or args.once
+    decode_options = {
+        "language": args.language,
+        "word_timestamps": args.timestamps,
+        "beam_size": args.beam_size if args.beam_size is not None else (1 if fast else 5),
+        "condition_on_previous_text": not (args.no_condition or fast),
+    }
+    batching = args.batch is not None and not args.once
+    pending: list[tuple[NDArray[np.float32], float]] = []
+
+    from vv.audio import record_audio
+    from vv.backends import get_backend
+    from vv.daemon import connect
+
+    # Initialize backend and load model, reusing a running daemon if there is one
+    backend = connect() or get_backend()
 
     if not args.quiet:
         print("=" * 50)
@@ -186,6 +384,30 @@ def main() -> int:
     if not args.quiet:
         print("Model loaded.\n")
 
+    # Open the output file once for all sessions; line buffering flushes
+    # each transcription as it is written
+    out_file: TextIO | None = None
+    if args.output:
+        try:
+            out_file = open(args.output, "a", buffering=1)
+        except OSError as e:
+            print(f"Error writing to file: {e}", file=sys.stderr)
+            return 1
+
+    def flush_pending() -> bool:
+        """Transcribe and output queued short recordings."""
+        if not pending:
+            return True
+        if not args.quiet:
+            print(f"Transcribing {len(pending)} queued recording(s)...")
+        results = backend.transcribe_batch([audio for audio, _ in pending], **decode_options)
+        durations = [duration for _, duration in pending]
+        pending.clear()
+        return all(
+            _output_result(result, duration, args, out_file)
+            for result, duration in zip(results, durations)
+        )
+
     session_count = 0
 
     try:
@@ -199,68 +421,55 @@ def main() -> int:
                 print(f"[Session {session_count}] {prompt}...")
                 input()
 
-            # Record audio
+            # Record audio. Without --batch, completed chunks are transcribed
+            # while recording continues.
+            chunk_queue: queue.Queue[NDArray[np.float32] | None] | None = None
+            transcriber = None
+            if not batching:
+                chunk_queue = queue.Queue()
+                transcriber = TranscriptionThread(backend, chunk_queue, **decode_options)
+                transcriber.start()
             audio_data, duration, sample_rate = record_audio(
                 sample_rate=16000,
                 quiet=args.quiet,
+                chunk_queue=chunk_queue,
             )
 
             if len(audio_data) == 0:
+                if transcriber is not None:
+                    transcriber.join()
                 if not args.quiet:
                     print("No audio recorded. Try again.\n")
                 if args.once:
                     return 1
                 continue
 
+            if batching:
+                if duration < BATCH_MAX_SECONDS:
+                    # Copy out of the recording buffer, which is not kept
+                    pending.append((audio_data.copy(), duration))
+                    if len(pending) < args.batch:
+                        if not args.quiet:
+                            print(f"Queued for transcription ({len(pending)}/{args.batch}).\n")
+                        continue
+                    if not flush_pending():
+                        return 1
+                    continue
+                # Keep output in recording order
+                if not flush_pending():
+                    return 1
+
             if not args.quiet:
                 print("Transcribing...")
 
-            # Transcribe
-            result = backend.transcribe(
-                audio_data,
-                language=args.language,
-                word_timestamps=args.timestamps,
-            )
-
-            # Format output
-            output = format_output(
-                result,
-                duration,
-                show_timestamps=args.timestamps,
-                quiet=args.quiet,
-            )
-
-            # Handle output destinations
-            if args.output:
-                try:
-                    with open(args.output, "a") as f:
-                        f.write(output)
-                        if not output.endswith("\n"):
-                            f.write("\n")
-                    if not args.quiet:
-                        print(f"Saved to {args.output}")
-                except OSError as e:
-                    print(f"Error writing to file: {e}", file=sys.stderr)
-                    return 1
+            if transcriber is not None:
+                # Wait for the remaining audio to be transcribed
+                result = transcriber.result()
             else:
-                print(output)
-
-            # Copy to clipboard if requested
-            if args.copy:
-                text_to_copy = result.text
-                if args.timestamps and result.segments:
-                    lines = []
-                    for seg in result.segments:
-                        start = format_timestamp(seg["start"])
-                        end = format_timestamp(seg["end"])
-                        lines.append(f"[{start}-{end}] {seg['text']}")
-                    text_to_copy = "\n".join(lines)
-
-                if copy_to_clipboard(text_to_copy):
-                    if not args.quiet:
-                        print("Copied to clipboard.")
-                else:
-                    print("Warning: Could not copy to clipboard", file=sys.stderr)
+                result = backend.transcribe(audio_data, **decode_options)
+
+            if not _output_result(result, duration, args, out_file):
+                return 1
 
             # Exit if single-shot mode
             if args.once:
@@ -268,8 +477,15 @@ def main() -> int:
 
     except KeyboardInterrupt:
         if not args.quiet:
-            print("\n\nGoodbye!")
+            print("\n")
+        if not flush_pending():
+            return 1
+        if not args.quiet:
+            print("Goodbye!")
         return 0
+    finally:
+        if out_file is not None:
+            out_file.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,329 @@
+"""Transcription daemon that keeps a model loaded between vv invocations.
+
+The daemon listens on a Unix domain socket. Each connection carries one
+request: a JSON header line, optionally followed by the audio as raw int16
+PCM. The reply is a single JSON line.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import stat
+import sys
+import tempfile
+from array import array
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from vv._fast import from_pcm16, to_pcm16
+from vv._scratch import ScratchBuffers, get_float_buf
+from vv.backends import Segment, TranscriptionBackend, TranscriptionResult, get_backend
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+# Seconds to wait for a running daemon before falling back to in-process loading
+CONNECT_TIMEOUT = 0.5
+
+
+def is_supported() -> bool:
+    """Return True if the platform supports Unix domain sockets."""
+    return hasattr(socket, "AF_UNIX")
+
+
+def socket_path() -> str:
+    """Return the socket path, preferring $XDG_RUNTIME_DIR.
+
+    Without it, the socket lives in a per-user directory under the shared
+    temp dir so other users cannot claim the path first.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "vv.sock")
+    return os.path.join(tempfile.gettempdir(), f"vv-{os.getuid()}", "vv.sock")
+
+
+def _is_private_dir(path: str) -> bool:
+    """Return True if path is a directory only the current user can access."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(st.st_mode)
+        and st.st_uid == os.getuid()
+        and stat.S_IMODE(st.st_mode) & 0o077 == 0
+    )
+
+
+def _is_trusted_socket(path: str) -> bool:
+    """Return True if path is a socket owned by the current user in a private directory.
+
+    Anyone who can listen on the socket receives the microphone audio and
+    controls the text vv prints, so refuse sockets another user could own.
+    """
+    if not _is_private_dir(os.path.dirname(path)):
+        return False
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid()
+
+
+def _send_message(sock: socket.socket, header: dict[str, Any], payload: bytes = b"") -> None:
+    sock.sendall(json.dumps(header).encode("utf-8") + b"\n")
+    if payload:
+        sock.sendall(payload)
+
+
+def _recv_message(sock: socket.socket) -> tuple[dict[str, Any], bytes]:
+    with sock.makefile("rb") as f:
+        line = f.readline()
+        if not line:
+            raise ConnectionError("Connection closed by peer")
+        header = json.loads(line)
+        payload = f.read(header.get("nbytes", 0))
+    return header, payload
+
+
+def _segment_to_dict(segment: Segment) -> dict[str, Any]:
+    return {
+        "start": segment.start,
+        "end": segment.end,
+        "text": segment.text,
+        "words": segment.words,
+        "word_starts": list(segment.word_starts),
+        "word_ends": list(segment.word_ends),
+    }
+
+
+def _segment_from_dict(data: dict[str, Any]) -> Segment:
+    if not data["words"]:
+        return Segment(data["start"], data["end"], data["text"])
+    return Segment(
+        data["start"],
+        data["end"],
+        data["text"],
+        words=tuple(data["words"]),
+        word_starts=array("d", data["word_starts"]),
+        word_ends=array("d", data["word_ends"]),
+    )
+
+
+def _result_to_dict(result: TranscriptionResult) -> dict[str, Any]:
+    return {
+        "text": result.text,
+        "segments": [_segment_to_dict(seg) for seg in result.segments],
+        "language": result.language,
+    }
+
+
+def _decode_audio(payload: bytes) -> NDArray[np.float32]:
+    """Convert an int16 PCM payload to float32 in a buffer reused across requests."""
+    pcm = np.frombuffer(payload, dtype=np.int16)
+    return from_pcm16(pcm, out=get_float_buf(len(pcm), "daemon"))
+
+
+def _handle_connection(
+    conn: socket.socket,
+    backend: TranscriptionBackend,
+    model_size: str,
+) -> str:
+    """Serve a single request and return the model size now loaded."""
+    header, payload = _recv_message(conn)
+
+    if header.get("op") == "ping":
+        _send_message(conn, {"ok": True, "backend": backend.name})
+        return model_size
+
+    audio = _decode_audio(payload)
+    # Backends report failures by exiting; keep the daemon alive instead
+    try:
+        if header["model"] != model_size:
+            backend.load_model(header["model"])
+            model_size = header["model"]
+        result = backend.transcribe(
+            audio,
+            language=header.get("language"),
+            word_timestamps=header.get("word_timestamps", False),
+            beam_size=header.get("beam_size", 5),
+            condition_on_previous_text=header.get("condition_on_previous_text", True),
+        )
+    except SystemExit:
+        _send_message(conn, {"error": "transcription failed, see daemon log"})
+        return model_size
+
+    _send_message(conn, _result_to_dict(result))
+    return model_size
+
+
+def serve(model_size: str, quiet: bool = False) -> int:
+    """Load a model and serve transcription requests until interrupted.
+
+    Args:
+        model_size: Whisper model to keep loaded
+        quiet: If True, suppress status messages
+
+    Returns:
+        Process exit code
+    """
+    if not is_supported():
+        print("Error: The daemon requires Unix domain sockets.", file=sys.stderr)
+        return 1
+
+    path = socket_path()
+    if connect(path) is not None:
+        print(f"Error: A vv daemon is already listening on {path}", file=sys.stderr)
+        return 1
+
+    backend = get_backend()
+    if not quiet:
+        print(f"Backend: {backend.name}")
+        print(f"Loading model '{model_size}'...")
+    backend.load_model(model_size)
+
+    socket_dir = os.path.dirname(path)
+    try:
+        os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+    except OSError as e:
+        print(f"Error: Cannot create {socket_dir}: {e}", file=sys.stderr)
+        return 1
+    if not _is_private_dir(socket_dir):
+        print(
+            f"Error: {socket_dir} must be owned by you and not accessible to others",
+            file=sys.stderr,
+        )
+        return 1
+
+    try:
+        if os.path.lexists(path):
+            os.unlink(path)  # Stale socket from a daemon that did not shut down cleanly
+    except OSError as e:
+        print(f"Error: Cannot remove stale socket {path}: {e}", file=sys.stderr)
+        return 1
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)  # Socket is only accessible to the current user
+    try:
+        server.bind(path)
+    finally:
+        os.umask(old_umask)
+    server.listen()
+
+    if not quiet:
+        print(f"Listening on {path} (Ctrl+C to stop)")
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                try:
+                    model_size = _handle_connection(conn, backend, model_size)
+                except (OSError, ValueError, KeyError) as e:
+                    print(f"Warning: Dropped request: {e}", file=sys.stderr)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        os.unlink(path)
+
+    return 0
+
+
+class DaemonBackend(TranscriptionBackend):
+    """Transcription backend that forwards audio to a running vv daemon."""
+
+    def __init__(self, path: str, remote_name: str) -> None:
+        self._path = path
+        self._remote_name = remote_name
+        self._model_size: str | None = None
+        # Owned by the backend rather than the thread: the CLI transcribes
+        # each session on a new thread, which would drop thread-local buffers
+        self._scratch = ScratchBuffers()
+
+    @property
+    def name(self) -> str:
+        return f"{self._remote_name} (daemon)"
+
+    def load_model(self, model_size: str) -> None:
+        """Record the model size; the daemon loads it on the first request."""
+        self._model_size = model_size
+
+    def transcribe(
+        self,
+        audio: NDArray[np.float32],
+        language: str | None = None,
+        word_timestamps: bool = False,
+        beam_size: int = 5,
+        condition_on_previous_text: bool = True,
+    ) -> TranscriptionResult:
+        """Send audio to the daemon and return its transcription.
+
+        Args:
+            audio: Audio data as float32 numpy array (mono, 16kHz)
+            language: Language code or None for auto-detect
+            word_timestamps: Whether to include word-level timestamps
+            beam_size: Beam width for decoding; 1 decodes greedily
+            condition_on_previous_text: Whether to prompt each window with
+                the text decoded so far
+
+        Returns:
+            TranscriptionResult with text and segments
+        """
+        if self._model_size is None:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+
+        # int16 halves the bytes sent; microphone audio is clipped, so nothing is lost
+        payload = to_pcm16(audio, self._scratch).tobytes()
+        header = {
+            "model": self._model_size,
+            "language": language,
+            "word_timestamps": word_timestamps,
+            "beam_size": beam_size,
+            "condition_on_previous_text": condition_on_previous_text,
+            "nbytes": len(payload),
+        }
+
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(self._path)
+                _send_message(sock, header, payload)
+                response, _ = _recv_message(sock)
+        except OSError as e:
+            print(f"Error: Lost connection to vv daemon: {e}", file=sys.stderr)
+            sys.exit(5)
+
+        if "error" in response:
+            print(f"Error during transcription: {response['error']}", file=sys.stderr)
+            sys.exit(5)
+
+        return TranscriptionResult(
+            text=response["text"],
+            segments=[_segment_from_dict(seg) for seg in response["segments"]],
+            language=response["language"],
+        )
+
+
+def connect(path: str | None = None) -> DaemonBackend | None:
+    """Return a DaemonBackend if a daemon is listening, else None."""
+    if not is_supported():
+        return None
+
+    path = path or socket_path()
+    if not _is_trusted_socket(path):
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(path)
+            _send_message(sock, {"op": "ping"})
+            response, _ = _recv_message(sock)
+    except (OSError, ValueError):
+        return None
+
+    return DaemonBackend(path, response.get("backend", "unknown"))
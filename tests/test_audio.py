@@ -0,0 +1,139 @@
+"""Tests for audio recording with a simulated input stream."""
+
+import queue
+import sys
+import types
+
+import numpy as np
+import pytest
+
+try:
+    import sounddevice  # noqa: F401
+except OSError:
+    # PortAudio is not installed; record_audio only needs these names
+    stub = types.ModuleType("sounddevice")
+    stub.PortAudioError = type("PortAudioError", (Exception,), {})
+    stub.CallbackFlags = object
+    stub.RawInputStream = None
+    sys.modules["sounddevice"] = stub
+
+from vv import audio
+from vv.audio import list_devices, record_audio, stream_chunks
+
+SAMPLE_RATE = 1000
+
+
+def _blocks(n_blocks, frames=100):
+    # Distinct values so out-of-order or duplicated samples are caught
+    samples = np.linspace(-0.9, 0.9, n_blocks * frames, dtype=np.float32)
+    return [samples[i : i + frames] for i in range(0, len(samples), frames)]
+
+
+@pytest.fixture
+def microphone(monkeypatch):
+    """Feed the given blocks to record_audio's callback, then press Enter."""
+    fed = []
+
+    class FakeRawInputStream:
+        def __init__(self, samplerate, channels, dtype, callback):
+            self._callback = callback
+
+        def __enter__(self):
+            for block in fed:
+                self._callback(block.tobytes(), len(block), {}, None)
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(audio.sd, "RawInputStream", FakeRawInputStream)
+    monkeypatch.setattr("builtins.input", lambda *args: "")
+    return fed
+
+
+def _drain(chunk_queue):
+    chunks = list(stream_chunks(chunk_queue))
+    assert chunk_queue.empty()
+    return chunks
+
+
+class TestListDevices:
+    """Tests for list_devices function."""
+
+    DEVICES = [
+        {"name": "Speakers", "max_input_channels": 0},
+        {"name": "USB Mic", "max_input_channels": 1},
+    ]
+
+    def test_marks_default_input(self, monkeypatch):
+        def query_devices(device=None, kind=None):
+            return self.DEVICES[1] if kind == "input" else self.DEVICES
+
+        monkeypatch.setattr(audio.sd, "query_devices", query_devices, raising=False)
+        assert list_devices().splitlines()[2:] == ["  [1] USB Mic (default)"]
+
+    def test_no_default_input(self, monkeypatch):
+        def query_devices(device=None, kind=None):
+            if kind == "input":
+                raise audio.sd.PortAudioError("Error querying device -1")
+            return self.DEVICES
+
+        monkeypatch.setattr(audio.sd, "query_devices", query_devices, raising=False)
+        assert list_devices().splitlines()[2:] == ["  [1] USB Mic"]
+
+
+class TestRecordAudio:
+    """Tests for record_audio function."""
+
+    def test_returns_recorded_samples(self, microphone):
+        microphone.extend(_blocks(5))
+        data, duration, sample_rate = record_audio(SAMPLE_RATE, quiet=True)
+        np.testing.assert_array_equal(data, np.concatenate(microphone))
+        assert duration == 0.5
+        assert sample_rate == SAMPLE_RATE
+
+    def test_clips_out_of_range_samples(self, microphone):
+        microphone.append(np.array([-3.0, -0.5, 0.5, 3.0], dtype=np.float32))
+        chunk_queue = queue.Queue()
+        data, _, _ = record_audio(SAMPLE_RATE, quiet=True, chunk_queue=chunk_queue)
+        np.testing.assert_array_equal(data, [-1.0, -0.5, 0.5, 1.0])
+        np.testing.assert_array_equal(np.concatenate(_drain(chunk_queue)), data)
+
+    def test_chunks_concatenate_to_recording(self, microphone):
+        microphone.extend(_blocks(12))
+        chunk_queue = queue.Queue()
+        data, _, _ = record_audio(
+            SAMPLE_RATE, quiet=True, chunk_queue=chunk_queue, chunk_seconds=0.25
+        )
+        chunks = _drain(chunk_queue)
+        assert len(chunks) > 1
+        np.testing.assert_array_equal(np.concatenate(chunks), data)
+
+    def test_queues_tail_chunk_then_sentinel(self, microphone):
+        microphone.extend(_blocks(5))
+        chunk_queue = queue.Queue()
+        record_audio(SAMPLE_RATE, quiet=True, chunk_queue=chunk_queue, chunk_seconds=0.3)
+        assert len(chunk_queue.get_nowait()) == 300
+        assert len(chunk_queue.get_nowait()) == 200
+        assert chunk_queue.get_nowait() is None
+        assert chunk_queue.empty()
+
+    def test_long_recording_spills_past_arena(self, microphone, monkeypatch):
+        monkeypatch.setattr(audio, "MAX_SECONDS", 1)
+        microphone.extend(_blocks(15))
+        chunk_queue = queue.Queue()
+        data, duration, _ = record_audio(
+            SAMPLE_RATE, quiet=True, chunk_queue=chunk_queue, chunk_seconds=0.3
+        )
+        np.testing.assert_array_equal(data, np.concatenate(microphone))
+        assert duration == 1.5
+        np.testing.assert_array_equal(np.concatenate(_drain(chunk_queue)), data)
+
+    def test_empty_recording(self, microphone):
+        chunk_queue = queue.Queue()
+        data, duration, _ = record_audio(SAMPLE_RATE, quiet=True, chunk_queue=chunk_queue)
+        assert data.dtype == np.float32
+        assert len(data) == 0
+        assert duration == 0.0
+        assert chunk_queue.get_nowait() is None
+        assert chunk_queue.empty()
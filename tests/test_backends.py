@@ -0,0 +1,192 @@
+"""Tests for backend helpers that do not need a real model."""
+
+from array import array
+from types import SimpleNamespace
+
+import numpy as np
+
+from vv.backends import Segment, get_backend
+from vv.backends.faster import SAMPLE_RATE, FasterWhisperBackend
+
+
+class TestGetBackend:
+    """Tests for get_backend function."""
+
+    def test_returns_same_instance(self):
+        assert get_backend() is get_backend()
+
+
+class TestSegment:
+    """Tests for the Segment dataclass."""
+
+    def test_without_words_shares_empty_defaults(self):
+        a = Segment(0.0, 1.0, "a")
+        b = Segment(1.0, 2.0, "b")
+        assert a.word_starts == ()
+        assert a.word_starts is b.word_starts
+
+    def test_hashable_with_word_arrays(self):
+        segment = Segment(
+            0.0,
+            1.0,
+            "Hi",
+            words=(" Hi",),
+            word_starts=array("d", [0.0]),
+            word_ends=array("d", [1.0]),
+        )
+        assert hash(segment) == hash(Segment(0.0, 1.0, "Hi", words=(" Hi",)))
+
+
+class FakeWhisperModel:
+    """Emits one segment per 10s of audio, labelled with its absolute second."""
+
+    def __init__(self):
+        self.prompts = []
+
+    def transcribe(self, audio, language=None, initial_prompt=None, **kwargs):
+        self.prompts.append(initial_prompt)
+        step = 10 * SAMPLE_RATE
+        segments = [
+            SimpleNamespace(
+                start=i / SAMPLE_RATE,
+                end=min(i + step, len(audio)) / SAMPLE_RATE,
+                text=f" {int(audio[i])}",
+                words=None,
+            )
+            for i in range(0, len(audio), step)
+        ]
+        return iter(segments), SimpleNamespace(language=language or "en")
+
+
+def _chunks(seconds, chunk_seconds=5):
+    # Each sample holds the absolute second it was recorded in
+    audio = np.repeat(np.arange(seconds, dtype=np.float32), SAMPLE_RATE)
+    step = chunk_seconds * SAMPLE_RATE
+    return [audio[i : i + step] for i in range(0, len(audio), step)]
+
+
+class TestFasterWhisperTranscribe:
+    """Tests for FasterWhisperBackend.transcribe."""
+
+    def test_flattens_column_audio_without_copy(self):
+        seen = []
+
+        class RecordingModel(FakeWhisperModel):
+            def transcribe(self, audio, **kwargs):
+                seen.append(audio)
+                return super().transcribe(audio, **kwargs)
+
+        backend = FasterWhisperBackend()
+        backend._model = RecordingModel()
+        audio = np.zeros((16000, 1), dtype=np.float32)
+        backend.transcribe(audio)
+        assert seen[0].ndim == 1
+        assert np.shares_memory(seen[0], audio)
+
+
+class TestFasterWhisperTranscribeStream:
+    """Tests for FasterWhisperBackend.transcribe_stream."""
+
+    def _backend(self):
+        backend = FasterWhisperBackend()
+        backend._model = FakeWhisperModel()
+        return backend
+
+    def test_short_recording_is_one_pass(self):
+        backend = self._backend()
+        result = backend.transcribe_stream(_chunks(12))
+        assert result.text == "0 10"
+        assert backend._model.prompts == [None]
+
+    def test_long_recording_keeps_absolute_times(self):
+        backend = self._backend()
+        result = backend.transcribe_stream(_chunks(75))
+        assert result.text == "0 10 20 30 40 50 60 70"
+        assert [seg.start for seg in result.segments] == [0, 10, 20, 30, 40, 50, 60, 70]
+        assert result.segments[-1].end == 75
+        assert result.language == "en"
+
+    def test_earlier_text_is_passed_as_prompt(self):
+        backend = self._backend()
+        backend.transcribe_stream(_chunks(45))
+        assert backend._model.prompts == [None, " 0 10"]
+
+    def test_no_prompt_without_conditioning(self):
+        backend = self._backend()
+        backend.transcribe_stream(_chunks(45), condition_on_previous_text=False)
+        assert backend._model.prompts == [None, None]
+
+    def test_no_chunks(self):
+        result = self._backend().transcribe_stream([])
+        assert result.text == ""
+        assert result.segments == []
+
+
+class FakeBatchedPipeline:
+    """Merges clips into 30s windows like faster-whisper's collect_chunks.
+
+    Emits one segment per window, labelled with the first sample of each clip
+    merged into it and ending at the window's last non-zero sample.
+    """
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def transcribe(self, audio, clip_timestamps, batch_size, chunk_length=30, **kwargs):
+        self.batch_sizes.append(batch_size)
+        windows = [[]]
+        duration = 0.0
+        for clip in clip_timestamps:
+            length = clip["end"] - clip["start"]
+            if duration + length > chunk_length:
+                windows.append([])
+                duration = 0.0
+            windows[-1].append(clip)
+            duration += length
+
+        segments = []
+        offset = 0.0
+        for clips in windows:
+            samples = np.concatenate(
+                [audio[int(c["start"] * SAMPLE_RATE) : int(c["end"] * SAMPLE_RATE)] for c in clips]
+            )
+            labels = "+".join(f"clip{int(audio[int(c['start'] * SAMPLE_RATE)])}" for c in clips)
+            segments.append(
+                SimpleNamespace(
+                    seek=int(offset * 100),
+                    start=offset,
+                    end=round(offset + len(np.trim_zeros(samples, "b")) / SAMPLE_RATE, 3),
+                    text=f" {labels}",
+                    words=None,
+                )
+            )
+            offset += len(samples) / SAMPLE_RATE
+        return iter(segments), SimpleNamespace(language="en")
+
+
+class TestFasterWhisperTranscribeBatch:
+    """Tests for FasterWhisperBackend.transcribe_batch."""
+
+    def _backend(self):
+        backend = FasterWhisperBackend()
+        backend._model = SimpleNamespace(frames_per_second=100)
+        backend._batched = FakeBatchedPipeline()
+        return backend
+
+    def test_one_result_per_recording(self):
+        backend = self._backend()
+        # Short recordings that the pipeline would merge into one window
+        audios = [np.full(n, i + 1, dtype=np.float32) for i, n in enumerate([16001, 8003, 40000])]
+        results = backend.transcribe_batch(audios)
+        assert [r.text for r in results] == ["clip1", "clip2", "clip3"]
+        assert backend._batched.batch_sizes == [3]
+
+    def test_segment_times_are_relative_to_each_recording(self):
+        backend = self._backend()
+        audios = [np.ones(32000, dtype=np.float32), np.full(16000, 2, dtype=np.float32)]
+        results = backend.transcribe_batch(audios)
+        assert results[1].segments == [Segment(0.0, 1.0, "clip2")]
+        assert results[1].language == "en"
+
+    def test_empty_batch(self):
+        assert self._backend().transcribe_batch([]) == []
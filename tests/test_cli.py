@@ -1,8 +1,14 @@
 """Tests for CLI functions."""
 
 from vv import __version__
-from vv.backends import TranscriptionResult
-from vv.cli import create_parser, format_output, format_timestamp
+from vv.backends import Segment, TranscriptionResult
+from vv.cli import (
+    _segments_to_lines,
+    _write_stdout,
+    create_parser,
+    format_output,
+    format_timestamp,
+)
 
 
 class TestFormatTimestamp:
@@ -39,8 +45,8 @@ class TestFormatOutput:
         result = TranscriptionResult(
             text="Hello world",
             segments=[
-                {"start": 0.0, "end": 2.5, "text": "Hello"},
-                {"start": 2.5, "end": 5.0, "text": "world"},
+                Segment(0.0, 2.5, "Hello"),
+                Segment(2.5, 5.0, "world"),
             ],
         )
         output = format_output(result, duration=5.0, show_timestamps=True, quiet=True)
@@ -55,6 +61,50 @@ class TestFormatOutput:
         assert "Duration: 3.00s" in output
         assert "Language: en" in output
 
+    def test_full_output_uses_precomputed_lines(self):
+        result = TranscriptionResult(
+            text="Hello",
+            segments=[Segment(0.0, 2.5, "Hello")],
+        )
+        output = format_output(
+            result,
+            duration=2.5,
+            show_timestamps=True,
+            timestamp_lines=["[cached] Hello"],
+        )
+        assert "[cached] Hello" in output
+        assert "[0:00-0:02]" not in output
+
+
+class TestSegmentsToLines:
+    """Tests for _segments_to_lines function."""
+
+    def test_formats_each_segment(self):
+        segments = [
+            Segment(0.0, 59.9, "Hello"),
+            Segment(60.0, 125.0, "world"),
+        ]
+        assert _segments_to_lines(segments) == [
+            "[0:00-0:59] Hello",
+            "[1:00-2:05] world",
+        ]
+
+    def test_empty(self):
+        assert _segments_to_lines([]) == []
+
+
+class TestWriteStdout:
+    """Tests for _write_stdout function."""
+
+    def test_writes_text_and_newline(self, capsys):
+        _write_stdout("Hello wörld")
+        assert capsys.readouterr().out == "Hello wörld\n"
+
+    def test_keeps_order_with_print(self, capsys):
+        print("first")
+        _write_stdout("second")
+        assert capsys.readouterr().out == "first\nsecond\n"
+
 
 class TestCreateParser:
     """Tests for argument parser."""
@@ -68,6 +118,8 @@ class TestCreateParser:
         assert args.copy is False
         assert args.once is False
         assert args.quiet is False
+        assert args.beam_size is None
+        assert args.no_condition is False
 
     def test_model_flag(self):
         parser = create_parser()
@@ -86,6 +138,20 @@ class TestCreateParser:
         assert args.copy is True
         assert args.quiet is True
 
+    def test_decoding_flags(self):
+        parser = create_parser()
+        args = parser.parse_args(["--beam-size", "3", "--no-condition"])
+        assert args.beam_size == 3
+        assert args.no_condition is True
+
+    def test_batch_flag(self):
+        parser = create_parser()
+        assert parser.parse_args([]).batch is None
+        assert parser.parse_args(["--batch", "4"]).batch == 4
+
+    def test_parser_is_reused(self):
+        assert create_parser() is create_parser()
+
 
 class TestTranscriptionResult:
     """Tests for TranscriptionResult dataclass."""
@@ -97,7 +163,7 @@ class TestTranscriptionResult:
         assert result.language is None
 
     def test_with_all_fields(self):
-        segments = [{"start": 0, "end": 1, "text": "Hi"}]
+        segments = [Segment(0, 1, "Hi")]
         result = TranscriptionResult(text="Hi", segments=segments, language="en")
         assert result.text == "Hi"
         assert result.segments == segments
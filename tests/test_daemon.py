@@ -0,0 +1,146 @@
+"""Tests for the transcription daemon protocol."""
+
+import json
+import os
+import socket
+from array import array
+
+import numpy as np
+
+from vv.backends import Segment, TranscriptionBackend, TranscriptionResult
+from vv.daemon import (
+    _decode_audio,
+    _handle_connection,
+    _is_trusted_socket,
+    _recv_message,
+    _segment_from_dict,
+    _segment_to_dict,
+    _send_message,
+    connect,
+    socket_path,
+)
+
+
+class EchoBackend(TranscriptionBackend):
+    """Backend that reports what it was asked to transcribe."""
+
+    def __init__(self):
+        self.loaded = []
+
+    @property
+    def name(self):
+        return "echo"
+
+    def load_model(self, model_size):
+        self.loaded.append(model_size)
+
+    def transcribe(self, audio, language=None, word_timestamps=False, beam_size=5, **kwargs):
+        return TranscriptionResult(
+            text=f"{len(audio)} samples, beam {beam_size}",
+            segments=[Segment(0.0, 1.0, "hi")],
+            language=language,
+        )
+
+
+def _roundtrip(header, payload=b"", model_size="base", backend=None):
+    backend = backend or EchoBackend()
+    client, server = socket.socketpair()
+    with client, server:
+        _send_message(client, header, payload)
+        model_size = _handle_connection(server, backend, model_size)
+        response, _ = _recv_message(client)
+    return response, model_size
+
+
+class TestHandleConnection:
+    """Tests for _handle_connection function."""
+
+    def test_ping_reports_backend_name(self):
+        response, _ = _roundtrip({"op": "ping"})
+        assert response == {"ok": True, "backend": "echo"}
+
+    def test_transcribe_returns_result(self):
+        audio = np.zeros(160, dtype=np.int16).tobytes()
+        header = {"model": "base", "language": "en", "beam_size": 1, "nbytes": len(audio)}
+        response, _ = _roundtrip(header, audio)
+        assert response["text"] == "160 samples, beam 1"
+        assert response["language"] == "en"
+        assert [_segment_from_dict(seg) for seg in response["segments"]] == [
+            Segment(0.0, 1.0, "hi")
+        ]
+
+    def test_switches_model_on_request(self):
+        backend = EchoBackend()
+        _, model_size = _roundtrip({"model": "small", "nbytes": 0}, backend=backend)
+        assert model_size == "small"
+        assert backend.loaded == ["small"]
+
+
+class TestDecodeAudio:
+    """Tests for _decode_audio function."""
+
+    def test_converts_pcm16_to_float32(self):
+        pcm = np.array([-32767, 0, 32767], dtype=np.int16)
+        audio = _decode_audio(pcm.tobytes())
+        assert audio.dtype == np.float32
+        np.testing.assert_allclose(audio, [-1.0, 0.0, 1.0])
+
+    def test_reuses_buffer_for_smaller_payloads(self):
+        first = _decode_audio(np.zeros(100, dtype=np.int16).tobytes())
+        second = _decode_audio(np.zeros(50, dtype=np.int16).tobytes())
+        assert np.shares_memory(first, second)
+
+
+class TestSegmentSerialization:
+    """Tests for segment conversion to and from JSON."""
+
+    def test_roundtrip_with_words(self):
+        segment = Segment(
+            0.0,
+            1.5,
+            "Hi there",
+            words=(" Hi", " there"),
+            word_starts=array("d", [0.0, 0.5]),
+            word_ends=array("d", [0.5, 1.5]),
+        )
+        data = json.loads(json.dumps(_segment_to_dict(segment)))
+        assert _segment_from_dict(data) == segment
+
+    def test_roundtrip_without_words(self):
+        segment = Segment(0.0, 1.5, "Hi there")
+        data = json.loads(json.dumps(_segment_to_dict(segment)))
+        assert _segment_from_dict(data) == segment
+
+
+class TestSocketPath:
+    """Tests for socket location and ownership checks."""
+
+    def test_prefers_xdg_runtime_dir(self, monkeypatch):
+        monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+        assert socket_path() == "/run/user/1000/vv.sock"
+
+    def test_fallback_uses_per_user_directory(self, monkeypatch):
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        path = socket_path()
+        assert os.path.basename(os.path.dirname(path)) == f"vv-{os.getuid()}"
+
+    def test_trusts_own_socket_in_private_dir(self, tmp_path):
+        tmp_path.chmod(0o700)
+        path = str(tmp_path / "vv.sock")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            server.bind(path)
+            assert _is_trusted_socket(path)
+
+    def test_rejects_socket_in_shared_dir(self, tmp_path):
+        tmp_path.chmod(0o777)
+        path = str(tmp_path / "vv.sock")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            server.bind(path)
+            assert not _is_trusted_socket(path)
+            assert connect(path) is None
+
+    def test_rejects_non_socket(self, tmp_path):
+        tmp_path.chmod(0o700)
+        path = tmp_path / "vv.sock"
+        path.write_text("")
+        assert not _is_trusted_socket(str(path))
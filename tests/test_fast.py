@@ -0,0 +1,47 @@
+"""Tests for numeric kernels."""
+
+import threading
+
+import numpy as np
+
+from vv._fast import clip_inplace, from_pcm16, to_pcm16
+from vv._scratch import ScratchBuffers
+
+
+class TestClipInplace:
+    """Tests for clip_inplace function."""
+
+    def test_clamps_out_of_range_values(self):
+        x = np.array([-2.0, -1.0, -0.5, 0.0, 0.5, 1.0, 2.0], dtype=np.float32)
+        clip_inplace(x)
+        np.testing.assert_array_equal(x, [-1.0, -1.0, -0.5, 0.0, 0.5, 1.0, 1.0])
+
+    def test_modifies_view_in_place(self):
+        buf = np.full(8, 3.0, dtype=np.float32)
+        clip_inplace(buf[:4])
+        np.testing.assert_array_equal(buf, [1.0] * 4 + [3.0] * 4)
+
+
+class TestPcm16:
+    """Tests for to_pcm16 and from_pcm16 functions."""
+
+    def test_full_scale_maps_to_int16_range(self):
+        x = np.array([-1.0, 0.0, 1.0], dtype=np.float32)
+        np.testing.assert_array_equal(to_pcm16(x), [-32767, 0, 32767])
+
+    def test_roundtrip_within_one_step(self):
+        x = np.linspace(-1.0, 1.0, 1001, dtype=np.float32)
+        y = from_pcm16(to_pcm16(x))
+        assert y.dtype == np.float32
+        assert np.max(np.abs(x - y)) <= 1.0 / 32767.0
+
+    def test_owned_scratch_is_reused_across_threads(self):
+        x = np.linspace(-1.0, 1.0, 100, dtype=np.float32)
+        scratch = ScratchBuffers()
+        results = []
+        for _ in range(2):
+            thread = threading.Thread(target=lambda: results.append(to_pcm16(x, scratch)))
+            thread.start()
+            thread.join()
+        assert np.shares_memory(results[0], results[1])
+        np.testing.assert_array_equal(results[1], to_pcm16(x))
@@ -0,0 +1,40 @@
+"""Tests for scratch buffers."""
+
+import threading
+
+import numpy as np
+
+from vv._scratch import get_float_buf, get_int16_buf
+
+
+class TestScratchBuffers:
+    """Tests for get_float_buf and get_int16_buf functions."""
+
+    def test_returns_requested_length_and_dtype(self):
+        assert get_float_buf(10, "test-len").shape == (10,)
+        assert get_float_buf(10, "test-len").dtype == np.float32
+        assert get_int16_buf(7, "test-len").dtype == np.int16
+
+    def test_reuses_buffer_when_large_enough(self):
+        first = get_float_buf(100, "test-reuse")
+        second = get_float_buf(40, "test-reuse")
+        assert np.shares_memory(first, second)
+
+    def test_grows_by_doubling(self):
+        get_float_buf(100, "test-grow")
+        grown = get_float_buf(101, "test-grow")
+        assert grown.base is not None
+        assert len(grown.base) == 200
+
+    def test_keys_are_independent(self):
+        a = get_float_buf(10, "test-a")
+        b = get_float_buf(10, "test-b")
+        assert not np.shares_memory(a, b)
+
+    def test_threads_do_not_share_buffers(self):
+        main = get_float_buf(10, "test-thread")
+        other = []
+        thread = threading.Thread(target=lambda: other.append(get_float_buf(10, "test-thread")))
+        thread.start()
+        thread.join()
+        assert not np.shares_memory(main, other[0])